@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+"""Load test the backend API and report throughput and latency percentiles"""
+
+import argparse
+import http.client
+import http.cookiejar
+import json
+import math
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+REPORTS_DIR = Path(__file__).parent / "loadtest_reports"
+
+# Relative frequency of each scenario in the request mix
+SCENARIO_WEIGHTS = {
+    "list": 50,
+    "detail": 30,
+    "states": 15,
+    "run": 5,
+}
+
+# States the simulator stores per episode (STEPS_PER_EPISODE in the backend),
+# used to keep 'states' pagination within the history of the prepared run
+STEPS_PER_EPISODE = 20
+
+# Report fields compared against a baseline
+DELTA_KEYS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+class ApiClient:
+    """Minimal JSON client with its own cookie jar (one per virtual user)"""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+
+    def request(self, method, path, body=None):
+        """Send a request and return (status, parsed JSON or None)"""
+        data = None
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        req = urllib.request.Request(
+            self.base_url + path, data=data, headers=headers, method=method
+        )
+        try:
+            with self.opener.open(req, timeout=self.timeout) as response:
+                payload = response.read()
+                status = response.status
+        except urllib.error.HTTPError as error:
+            return error.code, None
+        try:
+            return status, json.loads(payload) if payload else None
+        except ValueError:
+            return status, None
+
+    def login(self, username, password):
+        status, _ = self.request(
+            "POST", "/api/auth/login", {"username": username, "password": password}
+        )
+        return status < 400
+
+
+def prepare(client, algorithm, run_episodes):
+    """Create and run one simulation so detail/states have data to return"""
+    status, simulation = client.request(
+        "POST", "/api/traffic/simulations",
+        {"name": f"loadtest-{int(time.time())}", "algorithm": algorithm},
+    )
+    if status >= 400 or not simulation or "id" not in simulation:
+        raise RuntimeError(f"Could not create a simulation (HTTP {status})")
+    sim_id = simulation["id"]
+    status, _ = client.request(
+        "POST", f"/api/traffic/simulations/{sim_id}/run", {"episodes": run_episodes}
+    )
+    if status >= 400:
+        raise RuntimeError(f"Could not run simulation {sim_id} (HTTP {status})")
+    return sim_id
+
+
+def scenario_request(name, sim_id, args):
+    """Method, path and body for one request of the given scenario"""
+    if name == "list":
+        return "GET", "/api/traffic/simulations", None
+    if name == "detail":
+        return "GET", f"/api/traffic/simulations/{sim_id}", None
+    if name == "states":
+        max_skip = max(args.run_episodes * STEPS_PER_EPISODE - args.page_size, 0)
+        skip = random.randint(0, max_skip)
+        return (
+            "GET",
+            f"/api/traffic/simulations/{sim_id}/states?skip={skip}&limit={args.page_size}",
+            None,
+        )
+    if name == "run":
+        return "POST", f"/api/traffic/simulations/{sim_id}/run", {"episodes": args.run_episodes}
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+def virtual_user(args, sim_id, scenarios, weights, deadline, results, lock):
+    """Issue requests back to back until the deadline, recording latencies
+
+    Only successful requests contribute latency samples; failures (HTTP
+    errors, refused connections, timeouts) are counted separately so they
+    do not skew the percentiles. Requests still in flight at the deadline
+    are not counted at all.
+    """
+    client = ApiClient(args.url, args.timeout)
+    samples = {name: [] for name in scenarios}
+    errors = {name: 0 for name in scenarios}
+    try:
+        if args.username and not client.login(args.username, args.password):
+            raise RuntimeError(f"Login failed for {args.username}")
+
+        while time.monotonic() < deadline:
+            name = random.choices(scenarios, weights)[0]
+            method, path, body = scenario_request(name, sim_id, args)
+            start = time.perf_counter()
+            try:
+                status, _ = client.request(method, path, body)
+            except (urllib.error.URLError, http.client.HTTPException, OSError):
+                status = 0
+            elapsed = time.perf_counter() - start
+            if time.monotonic() > deadline:
+                # Finished while draining, outside the measured window
+                break
+            if 200 <= status < 400:
+                samples[name].append(elapsed)
+            else:
+                errors[name] += 1
+    finally:
+        # Keep whatever was collected even if this user failed
+        with lock:
+            for name in scenarios:
+                results[name]["latencies"].extend(samples[name])
+                results[name]["errors"] += errors[name]
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(latencies, errors, duration):
+    """Request counts, successful throughput and latency percentiles"""
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        "requests": count + errors,
+        "errors": errors,
+        "throughput_rps": round(count / duration, 2) if duration else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+def git_revision():
+    """Short commit hash of the checkout, used to label reports"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(report, baseline=None):
+    print("\n" + "=" * 78)
+    print(f"Load test: {report['users']} users, {report['duration_s']}s "
+          f"(+{report.get('drain_s', 0)}s drain) against {report['url']} ({report['label']})")
+    print("=" * 78)
+    print(f"{'scenario':<10}{'requests':>10}{'errors':>8}{'req/s':>10}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = {**report["scenarios"], "total": report["total"]}
+    base_rows = {**baseline["scenarios"], "total": baseline["total"]} if baseline else {}
+    for name, stats in rows.items():
+        print(f"{name:<10}{stats['requests']:>10}{stats['errors']:>8}"
+              f"{stats['throughput_rps']:>10}{stats['p50_ms']:>10}"
+              f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}")
+        old = base_rows.get(name)
+        if isinstance(old, dict) and all(key in old for key in DELTA_KEYS):
+            print(f"{'  vs base':<10}{'':>18}"
+                  f"{stats['throughput_rps'] - old['throughput_rps']:>+10.2f}"
+                  f"{stats['p50_ms'] - old['p50_ms']:>+10.2f}"
+                  f"{stats['p95_ms'] - old['p95_ms']:>+10.2f}"
+                  f"{stats['p99_ms'] - old['p99_ms']:>+10.2f}")
+    print("=" * 78)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Smart Traffic RL API")
+    parser.add_argument("--url", default="http://localhost:8000", help="Backend base URL")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run")
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIO_WEIGHTS),
+        help="Comma-separated subset of: " + ", ".join(SCENARIO_WEIGHTS),
+    )
+    parser.add_argument("--algorithm", default="RL", choices=["RL", "Fixed"])
+    parser.add_argument("--run-episodes", type=int, default=10,
+                        help="Episodes per 'run' request (1-1000)")
+    parser.add_argument("--page-size", type=int, default=100,
+                        help="States returned per 'states' request")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-request timeout")
+    parser.add_argument("--username", help="Log each virtual user in first")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--label", help="Report label (defaults to the git revision)")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against")
+    parser.add_argument("--no-save", action="store_true", help="Do not write a report file")
+    args = parser.parse_args(argv)
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    if not 1 <= args.run_episodes <= 1000:
+        parser.error("--run-episodes must be between 1 and 1000")
+    if args.page_size < 1:
+        parser.error("--page-size must be at least 1")
+    return args
+
+
+def load_baseline(path):
+    """Read an earlier report, raising ValueError if it is not one"""
+    try:
+        baseline = json.loads(path.read_text())
+    except OSError as error:
+        raise ValueError(f"cannot read {path}: {error}")
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{path} is not valid JSON: {error}")
+    if (not isinstance(baseline, dict)
+            or not isinstance(baseline.get("scenarios"), dict)
+            or "total" not in baseline):
+        raise ValueError(f"{path} is not a load test report")
+    rows = {**baseline["scenarios"], "total": baseline["total"]}
+    for name, row in rows.items():
+        if not isinstance(row, dict) or not all(key in row for key in DELTA_KEYS):
+            raise ValueError(f"{path} has no comparable figures for '{name}'")
+    return baseline
+
+
+def main():
+    args = parse_args()
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIO_WEIGHTS]
+    if unknown:
+        print(f"✗ Unknown scenario(s): {', '.join(unknown)}")
+        return False
+    weights = [SCENARIO_WEIGHTS[name] for name in scenarios]
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except ValueError as error:
+            print(f"✗ Bad baseline: {error}")
+            return False
+
+    setup_client = ApiClient(args.url, args.timeout)
+    if args.username and not setup_client.login(args.username, args.password):
+        print("✗ Login failed")
+        return False
+    try:
+        sim_id = prepare(setup_client, args.algorithm, args.run_episodes)
+    except (RuntimeError, urllib.error.URLError, http.client.HTTPException, OSError) as error:
+        print(f"✗ Setup failed: {error}")
+        return False
+
+    results = {name: {"latencies": [], "errors": 0} for name in scenarios}
+    lock = threading.Lock()
+    started = time.monotonic()
+    deadline = started + args.duration
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        futures = [
+            pool.submit(virtual_user, args, sim_id, scenarios, weights,
+                        deadline, results, lock)
+            for _ in range(args.users)
+        ]
+    finished = time.monotonic()
+    # Throughput is measured over the load window; the time spent waiting for
+    # in-flight requests after the deadline is reported separately
+    elapsed = min(finished, deadline) - started
+    drain = max(finished - deadline, 0.0)
+
+    failed_users = 0
+    for future in futures:
+        try:
+            future.result()
+        except Exception as error:
+            failed_users += 1
+            print(f"✗ Virtual user stopped early: {error!r}")
+
+    label = args.label or git_revision()
+    report = {
+        "label": label,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "url": args.url,
+        "users": args.users,
+        "duration_s": round(elapsed, 2),
+        "drain_s": round(drain, 2),
+        "scenarios": {
+            name: summarize(data["latencies"], data["errors"], elapsed)
+            for name, data in results.items()
+        },
+    }
+    all_latencies = [t for data in results.values() for t in data["latencies"]]
+    report["total"] = summarize(
+        all_latencies, sum(data["errors"] for data in results.values()), elapsed
+    )
+
+    report["failed_users"] = failed_users
+
+    # Save before printing so a display problem never loses the run
+    path = None
+    if not args.no_save:
+        REPORTS_DIR.mkdir(exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = REPORTS_DIR / f"{stamp}-{label}.json"
+        path.write_text(json.dumps(report, indent=2))
+
+    print_report(report, baseline)
+    if path:
+        print(f"\n✓ Report saved to {path}")
+
+    return report["total"]["errors"] == 0 and failed_users == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -1,55 +1,215 @@
 #!/usr/bin/env python
 """Run both backend and frontend applications"""
 
-import subprocess
+import argparse
 import os
+import signal
+import subprocess
 import sys
+import time
+import urllib.error
+import urllib.request
 from pathlib import Path
 
+BACKEND_PORT = 8000
+FRONTEND_PORT = 5000
+BACKEND_APP = "app:app"      # FastAPI instance in backend/app/__init__.py
+FRONTEND_APP = "app:app"     # Flask instance in frontend/app.py
+READY_TIMEOUT = 30           # Seconds to wait for a server to answer
+SHUTDOWN_TIMEOUT = 10        # Seconds to wait before killing a server
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Run the Smart Traffic RL System")
+    parser.add_argument(
+        "--prod", action="store_true",
+        help="Serve with multi-worker uvicorn (backend) and waitress (frontend)"
+    )
+    parser.add_argument(
+        "--workers", type=int,
+        help="Backend worker processes in --prod mode, default CPU count "
+             "(frontend threads, minimum 4)"
+    )
+    parser.add_argument("--host", help="Interface to bind in --prod mode (default 0.0.0.0)")
+    parser.add_argument("--backend-port", type=int, help="Backend port in --prod mode")
+    parser.add_argument("--frontend-port", type=int, help="Frontend port in --prod mode")
+    args = parser.parse_args(argv)
+
+    # Dev mode runs main.py / app.py, which bind their own fixed ports
+    # and run a single process each
+    if not args.prod:
+        given = [
+            flag for flag, value in (
+                ("--workers", args.workers),
+                ("--host", args.host),
+                ("--backend-port", args.backend_port),
+                ("--frontend-port", args.frontend_port),
+            ) if value is not None
+        ]
+        if given:
+            parser.error(f"{', '.join(given)} can only be used with --prod")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.workers is None:
+        args.workers = os.cpu_count() or 1
+    if args.host is None:
+        args.host = "0.0.0.0"
+    if args.backend_port is None:
+        args.backend_port = BACKEND_PORT
+    if args.frontend_port is None:
+        args.frontend_port = FRONTEND_PORT
+    return args
+
+
+def probe_url(host, port, path):
+    """URL to check readiness of a server bound to host:port"""
+    if host in ("", "0.0.0.0", "::"):
+        # Wildcard binds answer on loopback
+        host = "127.0.0.1"
+    elif ":" in host:
+        host = f"[{host}]"
+    return f"http://{host}:{port}{path}"
+
+
+def backend_command(args):
+    """Command line for the FastAPI backend"""
+    if not args.prod:
+        return [sys.executable, "main.py"]
+    return [
+        sys.executable, "-m", "uvicorn", BACKEND_APP,
+        "--host", args.host,
+        "--port", str(args.backend_port),
+        "--workers", str(args.workers),
+        "--no-access-log",
+    ]
+
+
+def frontend_command(args):
+    """Command line for the Flask frontend"""
+    if not args.prod:
+        return [sys.executable, "app.py"]
+    return [
+        sys.executable, "-m", "waitress",
+        f"--host={args.host}",
+        f"--port={args.frontend_port}",
+        f"--threads={max(args.workers, 4)}",
+        FRONTEND_APP,
+    ]
+
+
+def frontend_env(args, env):
+    """Environment for the frontend, pointing it at the backend we started"""
+    if not args.prod:
+        # Dev backend always listens on the documented default
+        return env
+    return {**env, "API_BASE_URL": probe_url(args.host, args.backend_port, "/api")}
+
+
+def start(command, cwd, env):
+    """Start a server process in its own process group"""
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    return subprocess.Popen(command, cwd=cwd, env=env, **kwargs)
+
+
+def wait_until_ready(url, proc, timeout=READY_TIMEOUT):
+    """Poll url until it answers, the process dies or timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status < 500:
+                    return True
+        except urllib.error.HTTPError as error:
+            # Any non-5xx answer means the server is accepting requests
+            if error.code < 500:
+                return True
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def stop(procs, timeout=SHUTDOWN_TIMEOUT):
+    """Ask every server to exit, then kill whatever is left"""
+    for proc in procs:
+        if proc.poll() is None:
+            if sys.platform == "win32":
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(proc.pid, signal.SIGTERM)
+
+    deadline = time.monotonic() + timeout
+    for proc in procs:
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
 def main():
     """Start both applications"""
+    args = parse_args()
     project_root = Path(__file__).parent
-    
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    mode = f"production, {args.workers} workers" if args.prod else "development"
+
     print("=" * 60)
-    print("Smart Traffic RL System - Starting Applications")
+    print(f"Smart Traffic RL System - Starting Applications ({mode})")
     print("=" * 60)
-    
-    # Start backend
-    backend_proc = subprocess.Popen(
-        [sys.executable, "main.py"],
-        cwd=project_root / "backend",
-        env={**os.environ, "PYTHONUNBUFFERED": "1"}
-    )
-    
-    # Small delay
-    import time
-    time.sleep(2)
-    
-    # Start frontend
-    frontend_proc = subprocess.Popen(
-        [sys.executable, "app.py"],
-        cwd=project_root / "frontend",
-        env={**os.environ, "PYTHONUNBUFFERED": "1"}
-    )
-    
-    print("\n" + "=" * 60)
-    print("✓ Backend API running on http://localhost:8000")
-    print("✓ API Docs: http://localhost:8000/docs")
-    print("✓ Frontend running on http://localhost:5000")
-    print("=" * 60)
-    print("\nPress Ctrl+C to stop all applications\n")
-    
+
+    # SIGTERM (e.g. from a process manager) shuts down like Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    procs = []
     try:
-        backend_proc.wait()
-        frontend_proc.wait()
+        # Start backend and wait for its health check before the frontend
+        backend_proc = start(backend_command(args), project_root / "backend", env)
+        procs.append(backend_proc)
+        health_url = probe_url(args.host, args.backend_port, "/health")
+        if not wait_until_ready(health_url, backend_proc):
+            print(f"\n✗ Backend did not become ready at {health_url}")
+            stop(procs)
+            sys.exit(1)
+
+        # Start frontend
+        frontend_proc = start(
+            frontend_command(args), project_root / "frontend", frontend_env(args, env)
+        )
+        procs.append(frontend_proc)
+        frontend_url = probe_url(args.host, args.frontend_port, "/")
+        if not wait_until_ready(frontend_url, frontend_proc):
+            print(f"\n✗ Frontend did not become ready at {frontend_url}")
+            stop(procs)
+            sys.exit(1)
+
+        print("\n" + "=" * 60)
+        print(f"✓ Backend API running on {probe_url(args.host, args.backend_port, '')}")
+        print(f"✓ API Docs: {probe_url(args.host, args.backend_port, '/docs')}")
+        print(f"✓ Frontend running on {probe_url(args.host, args.frontend_port, '')}")
+        print("=" * 60)
+        print("\nPress Ctrl+C to stop all applications\n")
+
+        # If either server exits, bring the other one down too
+        while all(proc.poll() is None for proc in procs):
+            time.sleep(0.5)
+        print("\nA server exited, stopping the remaining applications...")
+        stop(procs)
+        sys.exit(1)
     except KeyboardInterrupt:
         print("\n\nShutting down applications...")
-        backend_proc.terminate()
-        frontend_proc.terminate()
-        backend_proc.wait()
-        frontend_proc.wait()
+        stop(procs)
         print("Applications stopped.")
         sys.exit(0)
 
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+"""Unit tests for the load test harness"""
+
+import contextlib
+import io
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import loadtest
+
+
+class TestPercentile(unittest.TestCase):
+    """Test nearest-rank percentiles"""
+
+    def test_empty(self):
+        self.assertEqual(loadtest.percentile([], 95), 0.0)
+
+    def test_single_value(self):
+        self.assertEqual(loadtest.percentile([7], 50), 7)
+        self.assertEqual(loadtest.percentile([7], 99), 7)
+
+    def test_nearest_rank(self):
+        values = list(range(1, 31))  # 30 samples
+        self.assertEqual(loadtest.percentile(values, 50), 15)
+        self.assertEqual(loadtest.percentile(values, 95), 29)
+        self.assertEqual(loadtest.percentile(values, 99), 30)
+        self.assertEqual(loadtest.percentile(values, 100), 30)
+
+    def test_low_percentile(self):
+        self.assertEqual(loadtest.percentile([1, 2, 3, 4], 1), 1)
+
+
+class TestSummarize(unittest.TestCase):
+    """Test report statistics"""
+
+    def test_counts_and_throughput(self):
+        stats = loadtest.summarize([0.01, 0.02, 0.03, 0.04], 2, 2.0)
+        self.assertEqual(stats["requests"], 6)  # Successes plus errors
+        self.assertEqual(stats["errors"], 2)
+        self.assertEqual(stats["throughput_rps"], 2.0)  # Successes only
+
+    def test_percentiles_in_ms(self):
+        stats = loadtest.summarize([0.04, 0.01, 0.03, 0.02], 0, 1.0)
+        self.assertEqual(stats["p50_ms"], 20.0)
+        self.assertEqual(stats["p95_ms"], 40.0)
+        self.assertEqual(stats["max_ms"], 40.0)
+
+    def test_no_samples(self):
+        stats = loadtest.summarize([], 3, 1.0)
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["throughput_rps"], 0.0)
+        self.assertEqual(stats["p99_ms"], 0.0)
+        self.assertEqual(stats["max_ms"], 0.0)
+
+
+class TestScenarioRequest(unittest.TestCase):
+    """Test request construction per scenario"""
+
+    def setUp(self):
+        self.args = loadtest.parse_args(["--run-episodes", "10", "--page-size", "50"])
+
+    def test_list(self):
+        self.assertEqual(loadtest.scenario_request("list", 3, self.args),
+                         ("GET", "/api/traffic/simulations", None))
+
+    def test_detail(self):
+        self.assertEqual(loadtest.scenario_request("detail", 3, self.args),
+                         ("GET", "/api/traffic/simulations/3", None))
+
+    def test_states_pagination(self):
+        for _ in range(50):
+            method, path, body = loadtest.scenario_request("states", 3, self.args)
+            self.assertEqual(method, "GET")
+            self.assertIsNone(body)
+            self.assertTrue(path.startswith("/api/traffic/simulations/3/states?skip="))
+            self.assertTrue(path.endswith("&limit=50"))
+            skip = int(path.split("skip=")[1].split("&")[0])
+            self.assertTrue(0 <= skip <= 10 * 20 - 50)
+
+    def test_run(self):
+        self.assertEqual(loadtest.scenario_request("run", 3, self.args),
+                         ("POST", "/api/traffic/simulations/3/run", {"episodes": 10}))
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            loadtest.scenario_request("bogus", 3, self.args)
+
+
+class TestArguments(unittest.TestCase):
+    """Test argument validation and baseline loading"""
+
+    def test_rejects_zero_users(self):
+        with self.assertRaises(SystemExit):
+            loadtest.parse_args(["--users", "0"])
+
+    def test_run_episodes_range(self):
+        for value in ("0", "1001"):
+            with self.assertRaises(SystemExit):
+                loadtest.parse_args(["--run-episodes", value])
+        self.assertEqual(loadtest.parse_args(["--run-episodes", "1000"]).run_episodes, 1000)
+
+    def test_rejects_empty_page(self):
+        with self.assertRaises(SystemExit):
+            loadtest.parse_args(["--page-size", "0"])
+
+    def test_missing_baseline(self):
+        with self.assertRaises(ValueError):
+            loadtest.load_baseline(Path(tempfile.gettempdir()) / "no-such-report.json")
+
+    def test_baseline_round_trip(self):
+        row = loadtest.summarize([0.01, 0.02], 0, 1.0)
+        report = {"scenarios": {"list": row}, "total": row}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.json"
+            path.write_text(json.dumps(report))
+            self.assertEqual(loadtest.load_baseline(path), report)
+
+    def test_rejects_baseline_without_figures(self):
+        invalid = (
+            {"label": "x"},
+            {"scenarios": {}, "total": {}},
+            {"scenarios": {"list": {"requests": 1}}, "total": loadtest.summarize([], 0, 1.0)},
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.json"
+            for baseline in invalid:
+                path.write_text(json.dumps(baseline))
+                with self.assertRaises(ValueError):
+                    loadtest.load_baseline(path)
+
+
+class TestPrintReport(unittest.TestCase):
+    """Test report output against a baseline"""
+
+    def setUp(self):
+        row = loadtest.summarize([0.01, 0.02], 0, 1.0)
+        self.report = {
+            "label": "test", "url": "http://localhost:8000", "users": 1,
+            "duration_s": 1.0, "drain_s": 0.0,
+            "scenarios": {"list": row}, "total": row,
+        }
+
+    def test_skips_rows_without_figures(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            loadtest.print_report(self.report, {"scenarios": {"list": {}}, "total": {}})
+        self.assertNotIn("vs base", output.getvalue())
+
+    def test_prints_deltas(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            loadtest.print_report(self.report, self.report)
+        self.assertEqual(output.getvalue().count("vs base"), 2)
+
+
+class TestVirtualUser(unittest.TestCase):
+    """Test the per-user request loop"""
+
+    def setUp(self):
+        self.results = {"list": {"latencies": [], "errors": 0}}
+        self.lock = threading.Lock()
+
+    def test_login_failure_raises(self):
+        args = loadtest.parse_args(["--username", "alice"])
+        with mock.patch.object(loadtest.ApiClient, "login", return_value=False):
+            with self.assertRaises(RuntimeError):
+                loadtest.virtual_user(args, 1, ["list"], [1], time.monotonic() + 5,
+                                      self.results, self.lock)
+        self.assertEqual(self.results["list"], {"latencies": [], "errors": 0})
+
+    def test_drops_requests_finishing_after_deadline(self):
+        args = loadtest.parse_args([])
+        deadline = time.monotonic() + 0.3
+
+        def slow_request(self, method, path, body=None):
+            time.sleep(0.2)
+            return 200, None
+
+        with mock.patch.object(loadtest.ApiClient, "request", slow_request):
+            loadtest.virtual_user(args, 1, ["list"], [1], deadline, self.results, self.lock)
+        # The first request ends at ~0.2s, the second at ~0.4s (past the deadline)
+        self.assertEqual(len(self.results["list"]["latencies"]), 1)
+        self.assertEqual(self.results["list"]["errors"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+"""Unit tests for the application launcher"""
+
+import http.server
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+
+import run
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """Answers /health with 200 and everything else with 404"""
+
+    def do_GET(self):
+        self.send_response(200 if self.path == "/health" else 404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class RunningProcess:
+    """Stand-in for a Popen that never exits"""
+
+    def poll(self):
+        return None
+
+
+class TestParseArgs(unittest.TestCase):
+    """Test command line handling"""
+
+    def test_dev_defaults(self):
+        args = run.parse_args([])
+        self.assertFalse(args.prod)
+        self.assertEqual(args.backend_port, run.BACKEND_PORT)
+        self.assertEqual(args.frontend_port, run.FRONTEND_PORT)
+
+    def test_dev_rejects_prod_only_flags(self):
+        for flags in (["--backend-port", "9000"], ["--frontend-port", "9001"],
+                      ["--host", "10.0.0.5"], ["--workers", "2"]):
+            with self.assertRaises(SystemExit):
+                run.parse_args(flags)
+
+    def test_prod_accepts_ports(self):
+        args = run.parse_args(["--prod", "--backend-port", "9000", "--frontend-port", "9001"])
+        self.assertEqual(args.backend_port, 9000)
+        self.assertEqual(args.frontend_port, 9001)
+        self.assertEqual(args.host, "0.0.0.0")
+
+    def test_prod_default_workers(self):
+        self.assertEqual(run.parse_args(["--prod"]).workers, os.cpu_count() or 1)
+
+    def test_rejects_zero_workers(self):
+        with self.assertRaises(SystemExit):
+            run.parse_args(["--prod", "--workers", "0"])
+
+
+class TestCommands(unittest.TestCase):
+    """Test server command lines per mode"""
+
+    def test_dev_commands(self):
+        args = run.parse_args([])
+        self.assertEqual(run.backend_command(args), [sys.executable, "main.py"])
+        self.assertEqual(run.frontend_command(args), [sys.executable, "app.py"])
+
+    def test_prod_backend_command(self):
+        args = run.parse_args(["--prod", "--workers", "3", "--host", "10.0.0.5",
+                               "--backend-port", "9000"])
+        command = run.backend_command(args)
+        self.assertEqual(command[:4], [sys.executable, "-m", "uvicorn", run.BACKEND_APP])
+        self.assertEqual(command[command.index("--workers") + 1], "3")
+        self.assertEqual(command[command.index("--host") + 1], "10.0.0.5")
+        self.assertEqual(command[command.index("--port") + 1], "9000")
+
+    def test_prod_frontend_command(self):
+        args = run.parse_args(["--prod", "--workers", "2", "--frontend-port", "9001"])
+        command = run.frontend_command(args)
+        self.assertEqual(command[:3], [sys.executable, "-m", "waitress"])
+        self.assertIn("--port=9001", command)
+        self.assertIn("--threads=4", command)  # Minimum thread count
+        self.assertEqual(command[-1], run.FRONTEND_APP)
+
+
+class TestFrontendEnv(unittest.TestCase):
+    """Test the environment handed to the frontend"""
+
+    def test_dev_env_unchanged(self):
+        env = {"API_BASE_URL": "http://example:8000/api", "PATH": "/bin"}
+        self.assertEqual(run.frontend_env(run.parse_args([]), env), env)
+
+    def test_prod_points_at_backend(self):
+        args = run.parse_args(["--prod", "--backend-port", "9000"])
+        env = run.frontend_env(args, {"PATH": "/bin"})
+        self.assertEqual(env["API_BASE_URL"], "http://127.0.0.1:9000/api")
+        self.assertEqual(env["PATH"], "/bin")
+
+    def test_prod_specific_host(self):
+        args = run.parse_args(["--prod", "--host", "10.0.0.5"])
+        env = run.frontend_env(args, {})
+        self.assertEqual(env["API_BASE_URL"], "http://10.0.0.5:8000/api")
+
+
+class TestProbeUrl(unittest.TestCase):
+    """Test readiness probe addresses"""
+
+    def test_wildcard_uses_loopback(self):
+        self.assertEqual(run.probe_url("0.0.0.0", 8000, "/health"),
+                         "http://127.0.0.1:8000/health")
+        self.assertEqual(run.probe_url("::", 8000, "/health"),
+                         "http://127.0.0.1:8000/health")
+
+    def test_specific_host(self):
+        self.assertEqual(run.probe_url("10.0.0.5", 8000, "/health"),
+                         "http://10.0.0.5:8000/health")
+
+    def test_ipv6_host(self):
+        self.assertEqual(run.probe_url("::1", 5000, "/"), "http://[::1]:5000/")
+
+
+class TestWaitUntilReady(unittest.TestCase):
+    """Test readiness polling"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.port = cls.server.server_address[1]
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_ready_on_health(self):
+        url = f"http://127.0.0.1:{self.port}/health"
+        self.assertTrue(run.wait_until_ready(url, RunningProcess(), timeout=5))
+
+    def test_ready_on_client_error(self):
+        """A 404 still means the server is accepting requests"""
+        url = f"http://127.0.0.1:{self.port}/"
+        self.assertTrue(run.wait_until_ready(url, RunningProcess(), timeout=5))
+
+    def test_dead_process(self):
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        start = time.monotonic()
+        self.assertFalse(run.wait_until_ready("http://127.0.0.1:9/", proc, timeout=5))
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_timeout(self):
+        self.assertFalse(run.wait_until_ready("http://127.0.0.1:9/", RunningProcess(),
+                                              timeout=0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()